@@ -1,21 +1,35 @@
 # app.py
 import os
 import logging
+import math
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 import pytz
 import re
+from functools import wraps
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import orjson
+from cachetools import TTLCache
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import or_, and_, func, text
+from sqlalchemy import or_, and_, func, text, case, literal_column, select, update, delete, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import atexit
+from uuid import uuid4
+import asyncio
+import concurrent.futures
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 # Import your existing Playwright scraper logic
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightAsyncTimeout
 
 # Configure logging
 logging.basicConfig(
@@ -24,8 +38,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes API responses with orjson.
+    datetimes are encoded natively.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Compress JSON responses (list endpoints are large and highly repetitive)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+# Brotli first for clients that accept it; both at cheap levels since every
+# response (cached or not) is compressed per request
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
 
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost/carscraper')
@@ -38,6 +77,21 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_pre_ping': True,
     'pool_recycle': 300,
+    # Sized for gunicorn threads plus the scheduler jobs sharing one process
+    'pool_size': int(os.getenv('DB_POOL_SIZE', '20')),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+    'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '10')),
+    # Room for every distinct statement shape (search filter combinations included)
+    'query_cache_size': 1200,
+    # Batch executemany UPDATEs (enrichment flushes) with psycopg2's execute_batch;
+    # INSERTs already go out as multi-row VALUES
+    'executemany_mode': 'values_plus_batch',
+    'insertmanyvalues_page_size': 1000,
+    'connect_args': {
+        'application_name': 'willhaben-scraper',
+        # Keep a runaway query from tying up a connection (migrations lift this)
+        'options': f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '10000'))}",
+    },
 }
 
 db = SQLAlchemy(app)
@@ -47,10 +101,46 @@ CET = pytz.timezone('Europe/Vienna')
 
 # Fast scrape configuration
 FAST_SCRAPE_MAX_CARS = int(os.getenv('FAST_SCRAPE_MAX_CARS', '40'))
-FAST_SCRAPE_INTERVAL_SECONDS = float(os.getenv('FAST_SCRAPE_INTERVAL_SECONDS', '0.01'))
+FAST_SCRAPE_INTERVAL_SECONDS = float(os.getenv('FAST_SCRAPE_INTERVAL_SECONDS', '60'))
 POSTED_AT_HARD_OFFSET_HOURS = int(os.getenv('POSTED_AT_HARD_OFFSET_HOURS', '1'))
 POSTED_AT_HARD_OFFSET = timedelta(hours=POSTED_AT_HARD_OFFSET_HOURS)
 
+# Static HTML fast path - Playwright is only started when the plain GET
+# doesn't return enough listing cards
+STATIC_SCRAPE_ENABLED = os.getenv('STATIC_SCRAPE_ENABLED', 'true').lower() == 'true'
+STATIC_SCRAPE_MIN_LISTINGS = int(os.getenv('STATIC_SCRAPE_MIN_LISTINGS', '5'))
+STATIC_SCRAPE_TIMEOUT_SECONDS = float(os.getenv('STATIC_SCRAPE_TIMEOUT_SECONDS', '15'))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))  # Keep-alive connections per host
+
+# Browser path: scroll until no new listing links appear within SCROLL_SETTLE_MS (bounded)
+SCROLL_MAX_STEPS = int(os.getenv('SCROLL_MAX_STEPS', '5'))
+SCROLL_SETTLE_MS = int(os.getenv('SCROLL_SETTLE_MS', '400'))
+# Upper bound for one browser listing scrape; it runs under the scrape lock, so a
+# hung page must not keep every later scrape skipped
+LISTING_SCRAPE_TIMEOUT_SECONDS = float(os.getenv('LISTING_SCRAPE_TIMEOUT_SECONDS', '120'))
+
+# Detail pages opened at once (tabs in one shared browser context)
+DETAIL_SCRAPE_CONCURRENCY = int(os.getenv('DETAIL_SCRAPE_CONCURRENCY', '4'))
+# Upper bound for one detail batch so a hung browser can't block a scheduler thread
+DETAIL_SCRAPE_TIMEOUT_SECONDS = float(os.getenv('DETAIL_SCRAPE_TIMEOUT_SECONDS', '300'))
+
+# Read endpoints only change when the scrape or enrichment jobs commit, so serve
+# repeat GETs from memory
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv('RESPONSE_CACHE_TTL_SECONDS', '60'))
+_response_cache = TTLCache(maxsize=512, ttl=RESPONSE_CACHE_TTL_SECONDS)
+_response_cache_lock = threading.Lock()  # TTLCache is not thread-safe
+# /api/cars/latest keeps only the car, on a shorter TTL, so its timestamp stays per request
+LATEST_CAR_CACHE_TTL_SECONDS = float(os.getenv('LATEST_CAR_CACHE_TTL_SECONDS', '5'))
+_latest_car_cache = TTLCache(maxsize=1, ttl=LATEST_CAR_CACHE_TTL_SECONDS)
+
+# /health reports the last background DB ping instead of querying per probe
+DB_HEARTBEAT_INTERVAL_SECONDS = int(os.getenv('DB_HEARTBEAT_INTERVAL_SECONDS', '10'))
+DB_HEARTBEAT_MAX_AGE = timedelta(seconds=3 * DB_HEARTBEAT_INTERVAL_SECONDS)
+_db_heartbeat = {'ok_at': None, 'error': None}
+
+# Image URLs per car in list responses (0 = all); single-car endpoints return every URL
+LIST_IMAGE_URLS_LIMIT = int(os.getenv('LIST_IMAGE_URLS_LIMIT', '3'))
+
 # ============================================================================
 # DATABASE MODELS
 # ============================================================================
@@ -61,22 +151,23 @@ class Car(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     listing_id = db.Column(db.String(100), unique=True, nullable=False, index=True)
     title = db.Column(db.String(500), nullable=False)
-    price = db.Column(db.Numeric(10, 2))
+    price = db.Column(db.Float, index=True)
     currency = db.Column(db.String(10), default='EUR')
     brand = db.Column(db.String(100), index=True)
     model = db.Column(db.String(100))
-    year = db.Column(db.Integer)
+    year = db.Column(db.Integer, index=True)
     mileage = db.Column(db.Integer)
     fuel_type = db.Column(db.String(50))
     transmission = db.Column(db.String(50))
     location = db.Column(db.String(200))
-    image_urls = db.Column(db.JSON)  # Store array of image URLs
+    image_urls = db.Column(ARRAY(db.Text))  # Store array of image URLs
     url = db.Column(db.Text, nullable=False)
     description = db.Column(db.Text)
     posted_at = db.Column(db.DateTime)  # When the car was originally posted on Willhaben
     first_seen_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_seen_at = db.Column(db.DateTime, default=datetime.utcnow)
-    is_active = db.Column(db.Boolean, default=True, index=True)
+    # No standalone index: is_active is low-selectivity and leads (or scopes) the composite indexes below
+    is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -86,7 +177,7 @@ class Car(db.Model):
             'id': self.id,
             'listing_id': self.listing_id,
             'title': self.title,
-            'price': float(self.price) if self.price else None,
+            'price': self.price or None,
             'currency': self.currency,
             'brand': self.brand,
             'model': self.model,
@@ -98,13 +189,35 @@ class Car(db.Model):
             'image_urls': self.image_urls,  # Returns array like ["url1", "url2", ...]
             'url': self.url,
             'description': self.description,
-            'posted_at': self.posted_at.isoformat() if self.posted_at else None,
-            'first_seen_at': self.first_seen_at.isoformat() if self.first_seen_at else None,
-            'last_seen_at': self.last_seen_at.isoformat() if self.last_seen_at else None,
+            'posted_at': self.posted_at,
+            'first_seen_at': self.first_seen_at,
+            'last_seen_at': self.last_seen_at,
             'is_active': self.is_active,
         }
 
 
+# Composite indexes so the list endpoints can walk an index in sort order
+# instead of sorting all active rows
+db.Index(
+    'ix_cars_active_posted',
+    Car.is_active, Car.posted_at.desc().nulls_last(), Car.last_seen_at.desc(), Car.first_seen_at.desc()
+)
+db.Index(
+    'ix_cars_active_first_seen_id',
+    Car.first_seen_at.desc(), Car.id.desc(),
+    postgresql_where=Car.is_active
+)
+# Deactivation (active, not seen this run) and cleanup (inactive, not seen for
+# 7 days) both range-scan last_seen_at within one is_active value
+db.Index('ix_cars_active_last_seen', Car.is_active, Car.last_seen_at)
+# Case-insensitive brand prefix search (text_pattern_ops so LIKE 'x%' can use it)
+db.Index(
+    'ix_cars_brand_lower',
+    func.lower(Car.brand).label('brand_lower'),
+    postgresql_ops={'brand_lower': 'text_pattern_ops'}
+)
+
+
 class ScrapingLog(db.Model):
     __tablename__ = 'scraping_log'
     
@@ -118,10 +231,372 @@ class ScrapingLog(db.Model):
     error_message = db.Column(db.Text)
 
 
+# List endpoints slice image_urls in Postgres (arrays are 1-based) so the rest
+# never leaves the database
+_LIST_IMAGE_URLS = (
+    Car.image_urls[1:LIST_IMAGE_URLS_LIMIT].label('image_urls') if LIST_IMAGE_URLS_LIMIT > 0 else Car.image_urls
+)
+
+# Columns served by /api/cars; the full description is left out of that list.
+_CAR_LIST_COLUMNS = (
+    Car.id, Car.listing_id, Car.title, Car.price, Car.currency,
+    Car.brand, Car.model, Car.year, Car.mileage, Car.fuel_type, Car.transmission, Car.location,
+    _LIST_IMAGE_URLS, Car.url, Car.posted_at, Car.first_seen_at, Car.last_seen_at, Car.is_active,
+)
+# Same fields as Car.to_dict(), for list endpoints that still return the description
+_CAR_COLUMNS = _CAR_LIST_COLUMNS + (Car.description,)
+
+
+def _car_row_to_dict(row) -> Dict[str, Any]:
+    """Convert a row selected with _CAR_LIST_COLUMNS/_CAR_COLUMNS to an API dictionary"""
+    data = dict(row._mapping)
+    data.pop('total', None)
+    data['price'] = data['price'] or None
+    return data
+
+
+def _paginated_rows(stmt, page: int, limit: int):
+    """
+    Fetch one page of a list query with an inline COUNT(*) OVER(), so the rows
+    and the total arrive in a single round-trip. Returns (rows, total).
+    """
+    rows = db.session.execute(
+        stmt.add_columns(func.count().over().label('total'))
+        .limit(limit)
+        .offset((page - 1) * limit)
+    ).all()
+    if rows:
+        return rows, rows[0].total
+    if page > 1:
+        # Past the last page no row carries the total - count separately
+        total = db.session.execute(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        ).scalar()
+        return rows, total
+    return rows, 0
+
+
+def _pagination_dict(page: int, limit: int, total: int) -> Dict[str, Any]:
+    """Build the pagination block shared by list endpoints"""
+    pages = math.ceil(total / limit) if total else 0
+    return {
+        'page': page,
+        'limit': limit,
+        'total': total,
+        'pages': pages,
+        'has_next': page < pages,
+        'has_prev': page > 1
+    }
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE metacharacters in user input (use with escape='/')"""
+    return value.replace('/', '//').replace('%', '/%').replace('_', '/_')
+
+
+def _encode_cursor(row) -> str:
+    """Keyset cursor for a row ordered by (first_seen_at DESC, id DESC)"""
+    return f"{row.first_seen_at.isoformat()},{row.id}"
+
+
+def _decode_cursor(cursor: str):
+    """Parse a cursor from _encode_cursor; raises ValueError if malformed"""
+    ts, car_id = cursor.rsplit(',', 1)
+    return datetime.fromisoformat(ts), int(car_id)
+
+
+def cached_response(view):
+    """
+    Cache a read endpoint's JSON body per (path, query args) for
+    RESPONSE_CACHE_TTL_SECONDS. Only 200 responses are stored; the body is
+    cached before compression, so every hit gets a fresh response object.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        with _response_cache_lock:
+            body = _response_cache.get(key)
+        if body is not None:
+            return app.response_class(body, status=200, mimetype='application/json')
+
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            with _response_cache_lock:
+                _response_cache[key] = response.get_data()
+        return response
+    return wrapper
+
+
+def clear_response_cache():
+    """Drop all cached responses (called after every job that commits Car changes)"""
+    with _response_cache_lock:
+        _response_cache.clear()
+        _latest_car_cache.clear()
+
+
+# ============================================================================
+# BROWSER POOL
+# ============================================================================
+
+class BrowserPool:
+    """
+    Long-lived Chromium instance shared by all scrape jobs.
+    Playwright objects are bound to the event loop that created them, so the
+    pool owns a dedicated loop thread and callers submit coroutines to it.
+    Each scrape only opens (and closes) its own cheap BrowserContext.
+    """
+
+    LAUNCH_ARGS = [
+        '--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage',
+        # Headless scraping needs no GPU, extensions or first-run work, and
+        # skipping per-site renderer processes keeps memory down
+        '--disable-gpu', '--disable-extensions', '--no-first-run',
+        '--disable-features=IsolateOrigins,site-per-process',
+    ]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='browser-pool', daemon=True).start()
+            return self._loop
+
+    async def get_browser(self):
+        """Return the shared browser, launching it on first use or after a crash"""
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True, args=self.LAUNCH_ARGS)
+                logger.info("Browser pool: Chromium launched")
+            return self._browser
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the pool's event loop and block until it finishes.
+        On timeout the coroutine is cancelled and TimeoutError is raised.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _shutdown(self):
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+        self._browser = None
+        self._playwright = None
+
+    def close(self):
+        """Close the browser and stop the loop thread"""
+        if self._loop is None:
+            return
+        try:
+            self.run(self._shutdown(), timeout=10)
+        except Exception as e:
+            logger.warning(f"Browser pool shutdown failed: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+browser_pool = BrowserPool()
+app.extensions['browser_pool'] = browser_pool
+atexit.register(browser_pool.close)
+
+
 # ============================================================================
 # SCRAPER CLASS
 # ============================================================================
 
+_COMMON_BRANDS = [
+    'Abarth', 'Alfa Romeo', 'Aston Martin', 'Audi', 'Bentley', 'BMW', 'Bugatti',
+    'Cadillac', 'Chevrolet', 'Chrysler', 'Citroën', 'Citroen', 'Cupra', 'Dacia',
+    'Dodge', 'Ferrari', 'Fiat', 'Ford', 'Honda', 'Hummer', 'Hyundai', 'Infiniti',
+    'Jaguar', 'Jeep', 'Kia', 'Lamborghini', 'Lancia', 'Land Rover', 'Lexus',
+    'Maserati', 'Mazda', 'McLaren', 'Mercedes-Benz', 'Mercedes', 'MG', 'Mini',
+    'Mitsubishi', 'Nissan', 'Opel', 'Peugeot', 'Porsche', 'Renault', 'Rolls-Royce',
+    'Saab', 'Seat', 'Skoda', 'Smart', 'Subaru', 'Suzuki', 'Tesla', 'Toyota',
+    'Volkswagen', 'VW', 'Volvo'
+]
+
+# One alternation scanned once per title; longest names first so that
+# "Mercedes-Benz" wins over "Mercedes"
+_BRAND_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(b) for b in sorted(_COMMON_BRANDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_BRAND_CANONICAL = {b.upper(): b for b in _COMMON_BRANDS}
+_MODEL_RE = re.compile(r'^[\s\-]*([A-Za-z0-9\-]+(?:\s+[A-Za-z0-9\-]+)?)')
+_MODEL_CLEAN_RE = re.compile(r'[^\w\s\-]')
+
+# Listing IDs: /auto/bmw-123456789 or ?adId=123456789
+_LISTING_ID_PATH_RE = re.compile(r'[-/](\d{6,})(?:[/?]|$)')
+_LISTING_ID_QUERY_RE = re.compile(r'(?:adId|insertId|entryId)=(\d+)')
+
+_PRICE_RES = (re.compile(r'€\s*([\d.,]+)'), re.compile(r'([\d.,]+)\s*€'))
+# Year: a 4-digit token after a registration cue ("EZ 03/2018", "Erstzulassung: 2018"),
+# else only the card's first 4-digit token; later ones are often postcodes
+_YEAR_CUE_RE = re.compile(r'\b(?:EZ|Erstzulassung)\b\s*:?\s*(?:\d{1,2}\s*[./]\s*)?(\d{4})\b', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+_MILEAGE_RE = re.compile(r'([\d.]+)\s*km', re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r'\D')
+_LOCATION_RE = re.compile(r'\b(\d{4}\s+[A-ZÄÖÜa-zäöüß\s-]+?)(?:\n|$)')
+
+_POSTED_EXPLICIT_RE = re.compile(
+    r'(?:zuletzt\s+geändert|erstellt\s+am)\s*:?'  # label
+    r'\s*(\d{1,2}\.\d{1,2}\.\d{4})'            # date
+    r'(?:,\s*(\d{1,2}:\d{2}))?',                 # optional time
+    re.IGNORECASE
+)
+_POSTED_MINUTES_RE = re.compile(r'vor\s+(\d+)\s+minute[n]?')
+_POSTED_HOURS_RE = re.compile(r'vor\s+(\d+)\s+stunde[n]?')
+_POSTED_DAYS_RE = re.compile(r'vor\s+(\d+)\s+tag[en]?')
+_POSTED_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})(?:,\s*(\d{1,2}:\d{2}))?')
+
+# Card text is only needed for field parsing and the 500-char description;
+# capping it in the page keeps long cards from bloating the evaluate() payload.
+CARD_TEXT_MAX_CHARS = int(os.getenv('CARD_TEXT_MAX_CHARS', '1500'))
+
+# Price element on a result card, read before falling back to free-text regex
+_PRICE_SELECTOR = '[data-testid*="price"], [class*="Price"]'
+
+# Collects every listing link with its card text and thumbnail attributes in one
+# page.evaluate() call; parsing then happens in Python without further CDP traffic.
+_LISTING_EXTRACT_JS = '''([maxText, priceSelector, idPatterns]) => {
+    const cardOf = el => el.closest('article') ||
+                         el.closest('[class*="Card"]') ||
+                         el.closest('[class*="Item"]') ||
+                         el;
+    const galleryOf = el => el.closest('article') ||
+                            el.closest('[class*="Card"]') ||
+                            el.closest('[data-testid*="result"]') ||
+                            el;
+
+    // Cards hold several links to the same listing; keep the first per listing ID
+    // so innerText/getComputedStyle run once per card
+    const idRes = idPatterns.map(p => new RegExp(p));
+    const seen = new Map();
+    for (const a of document.querySelectorAll('a[href*="/gebrauchtwagen/"]')) {
+        const href = a.getAttribute('href') || '';
+        if (href.includes('/gebrauchtwagenboerse') || href.includes('/kategorie')) continue;
+        const m = idRes.map(re => href.match(re)).find(Boolean);
+        if (m && !seen.has(m[1])) seen.set(m[1], a);
+    }
+
+    const links = Array.from(seen.values()).map(a => {
+        const card = cardOf(a);
+        let img = a.querySelector('img') || card.querySelector('img');
+        if (!img) {
+            const gallery = galleryOf(a);
+            img = gallery.querySelector('img');
+        }
+        const priceNode = card.querySelector(priceSelector);
+        return {
+            href: a.getAttribute('href'),
+            priceText: priceNode ? (priceNode.innerText || '') : null,
+            linkText: (a.innerText || '').slice(0, 500),
+            text: (card.innerText || '').slice(0, maxText),
+            img: img ? {
+                src: img.getAttribute('src'),
+                dataSrc: img.getAttribute('data-src'),
+                dataLazySrc: img.getAttribute('data-lazy-src'),
+                dataOriginal: img.getAttribute('data-original'),
+                dataLazy: img.getAttribute('data-lazy'),
+                srcset: img.getAttribute('srcset')
+            } : null,
+            background: window.getComputedStyle(a).backgroundImage || ''
+        };
+    });
+
+    return {
+        links: links,
+        articleCount: document.querySelectorAll('article').length,
+        containerCount: document.querySelectorAll('[class*="ResultList"], [class*="SearchResult"], [data-testid*="result"]').length
+    };
+}'''
+
+# Requests the scraper never reads. Stylesheets stay: the thumbnail fallback
+# reads computed background-image styles.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+_BLOCKED_URL_PARTS = ('googletagmanager', 'google-analytics', 'doubleclick', 'facebook')
+
+
+async def _block_unneeded_requests(route) -> None:
+    """Playwright route handler: abort image/media/font and tracker requests"""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(part in request.url for part in _BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Detail page: gallery images, and blocks that carry the posting date
+_GALLERY_IMAGE_SELECTORS = (
+    'img[class*="gallery"]',
+    '[class*="ImageGallery"] img',
+    '[class*="Carousel"] img',
+    '[data-testid*="image"] img',
+    'picture img',
+    '.image-gallery img',
+)
+_DETAIL_METADATA_SELECTORS = (
+    '[data-testid*="metadata"]',
+    '[class*="Meta"]',
+    '[class*="Details"]',
+)
+
+# Shared HTTP session for static page fetches (keeps connections alive between scrapes).
+# The pool is sized for concurrent detail-page fetches from worker threads.
+http_session = requests.Session()
+http_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'de-AT,de;q=0.9',
+})
+http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE))
+
+
+def _closest(node, predicate):
+    """selectolax counterpart of Element.closest()"""
+    while node is not None and node.tag not in ('html', '-document'):
+        if predicate(node):
+            return node
+        node = node.parent
+    return None
+
+
+def _has_class(fragment: str):
+    return lambda n: fragment in (n.attributes.get('class') or '')
+
+
+def _largest_srcset_url(srcset: Optional[str]) -> Optional[str]:
+    """Pick the widest (or highest-density) candidate from a srcset attribute"""
+    best_url, best_size = None, -1.0
+    for candidate in (srcset or '').split(','):
+        parts = candidate.split()
+        if not parts:
+            continue
+        size = 1.0  # No descriptor means 1x
+        if len(parts) > 1 and parts[1][-1:] in ('w', 'x'):
+            try:
+                size = float(parts[1][:-1])
+            except ValueError:
+                pass
+        if size > best_size:
+            best_url, best_size = parts[0], size
+    return best_url
+
+
 class WillhabenScraper:
     """Scraper for willhaben.at car listings - Simplified robust version"""
     
@@ -140,303 +615,343 @@ class WillhabenScraper:
         Scrape car listings from willhaben.at
         Returns list of car dictionaries
         """
-        cars = []
-        
+        if STATIC_SCRAPE_ENABLED:
+            cars = self.scrape_via_http()
+            if cars:
+                return cars
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
-                )
-                
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    locale='de-AT'
-                )
-                
-                page = context.new_page()
-                
-                logger.info(f"Navigating to {self.BASE_URL}")
-                page.goto(self.BASE_URL, wait_until="domcontentloaded", timeout=45000)
+            return browser_pool.run(self.scrape_listings_async(), timeout=LISTING_SCRAPE_TIMEOUT_SECONDS)
+        except concurrent.futures.TimeoutError:
+            # run() has already cancelled the coroutine (closing its context)
+            raise TimeoutError(f"Browser listing scrape timed out after {LISTING_SCRAPE_TIMEOUT_SECONDS:g}s")
 
-                # Handle cookie consent - try multiple selectors
-                try:
-                    page.wait_for_timeout(1200)
-                    cookie_selectors = [
-                        'button#didomi-notice-agree-button',
-                        'button[data-testid="uc-accept-all-button"]',
-                        'button:has-text("Akzeptieren")',
-                        'button:has-text("Alle akzeptieren")'
-                    ]
-                    for selector in cookie_selectors:
-                        try:
-                            btn = page.query_selector(selector)
-                            if btn and btn.is_visible():
-                                btn.click()
-                                page.wait_for_timeout(1000)
-                                logger.info(f"Accepted cookies using selector: {selector}")
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    logger.info(f"No cookie dialog or already accepted: {e}")
+    def scrape_via_http(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the listing grid as static HTML and parse it with selectolax.
+        Returns an empty list when the page doesn't carry enough listings,
+        so the caller falls back to Playwright.
+        """
+        try:
+            response = http_session.get(self.BASE_URL, timeout=STATIC_SCRAPE_TIMEOUT_SECONDS)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Static fetch failed, falling back to browser: {e}")
+            return []
 
-                # Wait for page to fully load - reduced for speed
-                page.wait_for_timeout(1500)  # Quick wait for initial load
-                
-                # Scroll to trigger lazy loading - reduced for speed
-                logger.info("Scrolling to load content...")
-                for _ in range(1):
-                    page.evaluate("window.scrollBy(0, window.innerHeight)")
-                    page.wait_for_timeout(500)
-
-                # Try multiple strategies to find car listings
-                logger.info("Looking for car listings...")
-                
-                # Strategy 1: Find all links containing /gebrauchtwagen/
-                all_car_links = page.query_selector_all('a[href*="/gebrauchtwagen/"]')
-                logger.info(f"Strategy 1: Found {len(all_car_links)} links with /gebrauchtwagen/")
-                
-                # Strategy 2: Find article elements
-                articles = page.query_selector_all('article')
-                logger.info(f"Strategy 2: Found {len(articles)} article elements")
-                
-                # Strategy 3: Find any divs/sections that might contain listings
-                potential_containers = page.query_selector_all('[class*="ResultList"], [class*="SearchResult"], [data-testid*="result"]')
-                logger.info(f"Strategy 3: Found {len(potential_containers)} potential result containers")
-                
-                # Extract unique car listings
-                car_listings = []
-                seen_ids = set()
-                
-                # Process links from Strategy 1
-                for link in all_car_links:
-                    try:
-                        href = link.get_attribute('href')
-                        if not href:
-                            continue
+        try:
+            tree = LexborHTMLParser(response.text)
+            cards = [self._static_card(link) for link in tree.css('a[href*="/gebrauchtwagen/"]')]
+            car_listings = self._select_listings(cards)
+        except Exception as e:
+            logger.warning(f"Static parse failed, falling back to browser: {e}")
+            return []
 
-                        # Build full URL
-                        if not href.startswith('http'):
-                            full_url = f"https://www.willhaben.at{href}"
-                        else:
-                            full_url = href
-
-                        # Extract numeric ID from URL
-                        # Patterns: /auto/bmw-123456789 or ?adId=123456789
-                        id_match = re.search(r'[-/](\d{6,})(?:[/?]|$)', href)
-                        if not id_match:
-                            id_match = re.search(r'(?:adId|insertId|entryId)=(\d+)', href)
-                        
-                        if not id_match:
-                            continue
+        if len(car_listings) < STATIC_SCRAPE_MIN_LISTINGS:
+            logger.info(f"Static HTML only had {len(car_listings)} listings, falling back to browser")
+            return []
 
-                        listing_id = id_match.group(1)
+        logger.info(f"Static HTML: found {len(car_listings)} unique car listings")
+        cars = self._build_cars(car_listings)
+        logger.info(f"Scraping completed: {len(cars)} cars extracted")
+        return cars
 
-                        # Skip if we've seen this ID or if it's not a car detail page
-                        if listing_id in seen_ids:
-                            continue
-                        
-                        # Make sure it's actually a car listing page, not category/search page
-                        if '/gebrauchtwagenboerse' in href or '/kategorie' in href:
-                            continue
-                            
-                        seen_ids.add(listing_id)
-                        car_listings.append({
-                            'link_element': link,
-                            'url': full_url,
-                            'listing_id': listing_id
-                        })
-                        
-                    except Exception as e:
-                        logger.debug(f"Error processing link: {str(e)}")
-                        continue
-
-                logger.info(f"Found {len(car_listings)} unique car listings")
-                
-                if len(car_listings) == 0:
-                    logger.warning("No car listings found! Saving debug screenshot...")
-                    try:
-                        page.screenshot(path="/tmp/debug_screenshot.png")
-                        # Also save HTML for debugging
-                        html_content = page.content()
-                        with open("/tmp/debug_page.html", "w", encoding="utf-8") as f:
-                            f.write(html_content)
-                        logger.info("Debug files saved: /tmp/debug_screenshot.png and /tmp/debug_page.html")
-                    except:
-                        pass
-                    browser.close()
-                    return cars
-                
-                # Show first few examples
-                for i, listing in enumerate(car_listings[:3]):
-                    logger.info(f"Example listing {i+1}: {listing['url']}")
-                
-                # Process each car listing
-                for idx, listing_data in enumerate(car_listings[:self.max_cars]):
-                    try:
-                        link_element = listing_data['link_element']
-                        url = listing_data['url']
-                        listing_id = listing_data['listing_id']
-                        
-                        # Get text content
-                        try:
-                            # Try to get the parent article/container for full info
-                            parent_handle = link_element.evaluate_handle(
-                                'el => el.closest("article") || el.closest("[class*=\'Card\']") || el.closest("[class*=\'Item\']") || el.parentElement.parentElement'
-                            )
-                            parent = parent_handle.as_element()
-                            text_content = parent.inner_text() if parent else link_element.inner_text()
-                        except:
-                            text_content = link_element.inner_text()
-                        
-                        # Extract title
-                        link_text = link_element.inner_text().strip()
-                        title = link_text if len(link_text) > 5 else text_content.split('\n')[0]
-                        title = title[:500]
-                        
-                        if not title or len(title) < 3:
-                            title = f"Car Listing {listing_id}"
-                        
-                        # Extract thumbnail quickly but handle lazy-loading variations
-                        image_url = None
-                        try:
-                            img = None
-
-                            if not img:
-                                img = link_element.query_selector('img')
-
-                            if not img and parent:
-                                img = parent.query_selector('img')
-
-                            if not img:
-                                # Broader search via JavaScript for nested galleries/picture tags
-                                try:
-                                    img_handle = link_element.evaluate_handle('''el => {
-                                        let container = el.closest('article') ||
-                                                        el.closest('[class*="Card"]') ||
-                                                        el.closest('[data-testid*="result"]') ||
-                                                        el.parentElement?.parentElement;
-                                        if (!container) return null;
-
-                                        let img = container.querySelector('img');
-                                        if (img) return img;
-
-                                        let picture = container.querySelector('picture');
-                                        if (picture) {
-                                            img = picture.querySelector('img');
-                                            if (img) return img;
-                                        }
-
-                                        return null;
-                                    }''')
-                                    img = img_handle.as_element() if img_handle else None
-                                except Exception as je:
-                                    logger.debug(f"JS thumbnail lookup failed: {je}")
-
-                            if img:
-                                image_url = (
-                                    img.get_attribute('src') or
-                                    img.get_attribute('data-src') or
-                                    img.get_attribute('data-lazy-src') or
-                                    img.get_attribute('data-original') or
-                                    img.get_attribute('data-lazy')
-                                )
-
-                                if not image_url:
-                                    srcset = img.get_attribute('srcset')
-                                    if srcset:
-                                        parts = [segment.strip().split()[0] for segment in srcset.split(',') if segment.strip()]
-                                        if parts:
-                                            image_url = parts[0]
-
-                                if image_url:
-                                    if image_url.startswith('//'):
-                                        image_url = f"https:{image_url}"
-                                    elif image_url.startswith('/') and not image_url.startswith('//'):
-                                        image_url = f"https://www.willhaben.at{image_url}"
-                                    elif not image_url.startswith('http'):
-                                        image_url = f"https://www.willhaben.at/{image_url.lstrip('/')}"
-
-                                    lower_url = image_url.lower()
-                                    if 'placeholder' in lower_url or 'icon' in lower_url or image_url.endswith('.svg'):
-                                        image_url = None
-
-                            if not image_url:
-                                # Fallback for background-image thumbnails
-                                try:
-                                    bg_image = link_element.evaluate("el => window.getComputedStyle(el).backgroundImage || ''")
-                                    if bg_image and 'url(' in bg_image:
-                                        bg_url = bg_image.split('url(')[-1].rstrip(')').strip('"\' ')
-                                        if bg_url:
-                                            if bg_url.startswith('//'):
-                                                bg_url = f"https:{bg_url}"
-                                            elif bg_url.startswith('/'):
-                                                bg_url = f"https://www.willhaben.at{bg_url}"
-                                            elif not bg_url.startswith('http'):
-                                                bg_url = f"https://www.willhaben.at/{bg_url.lstrip('/')}"
-
-                                            lower_bg = bg_url.lower()
-                                            if 'placeholder' not in lower_bg and 'icon' not in lower_bg and not bg_url.endswith('.svg'):
-                                                image_url = bg_url
-                                except Exception as be:
-                                    logger.debug(f"Background image lookup failed: {be}")
-
-                        except Exception as e_img:
-                            logger.debug(f"Thumbnail extraction error: {e_img}")
-
-                        # Store as array for consistency
-                        image_urls = [image_url] if image_url else []
-
-                        # Initialize variables to avoid undefined errors
-                        price = self._extract_price(text_content)
-                        year = self._extract_year(text_content)
-                        mileage = self._extract_mileage(text_content)
-                        location = self._extract_location(text_content)
-                        posted_at = self._extract_posted_date(text_content)
-                        brand, model = self._parse_brand_model(title)
-
-                        car_data = {
-                            'listing_id': listing_id,
-                            'title': title,
-                            'price': price,
-                            'currency': 'EUR',
-                            'brand': brand,
-                            'model': model,
-                            'year': year,
-                            'mileage': mileage,
-                            'fuel_type': None,
-                            'transmission': None,
-                            'location': location,
-                            'image_urls': image_urls,  # Array instead of single URL
-                            'url': url,
-                            'description': text_content[:500] if text_content else title,
-                            'posted_at': posted_at,  # When car was posted on Willhaben
-                        }
-                        
-                        cars.append(car_data)
-                        logger.info(f"✓ {idx + 1}/{min(len(car_listings), self.max_cars)}: {title[:50]}... €{price or '?'}")
-                        
-                    except Exception as e:
-                        logger.error(f"✗ Error extracting car {idx + 1}: {str(e)}")
-                        continue
-                
-                browser.close()
-                logger.info(f"Scraping completed: {len(cars)} cars extracted")
-                
+    def _static_card(self, link) -> Dict[str, Any]:
+        """Same raw card shape as _LISTING_EXTRACT_JS, built from a selectolax node"""
+        # Without a card ancestor the link is its own card: a grandparent can be a
+        # container shared by several listings and would leak their price/image
+        card = (_closest(link, lambda n: n.tag == 'article') or
+                _closest(link, _has_class('Card')) or
+                _closest(link, _has_class('Item')) or
+                link)
+
+        img = link.css_first('img') or card.css_first('img')
+        if img is None:
+            gallery = (_closest(link, lambda n: n.tag == 'article') or
+                       _closest(link, _has_class('Card')) or
+                       _closest(link, lambda n: 'result' in (n.attributes.get('data-testid') or '')) or
+                       link)
+            img = gallery.css_first('img')
+
+        # No computed styles without a browser; only inline background-image is visible
+        style = link.attributes.get('style') or ''
+        background = style.split('background-image:', 1)[1].split(';', 1)[0].strip() if 'background-image:' in style else ''
+
+        price_node = card.css_first(_PRICE_SELECTOR)
+
+        return {
+            'href': link.attributes.get('href'),
+            'priceText': price_node.text(strip=True) if price_node is not None else None,
+            'linkText': link.text(separator='\n', strip=True)[:500],
+            'text': card.text(separator='\n', strip=True)[:CARD_TEXT_MAX_CHARS],
+            'img': {
+                'src': img.attributes.get('src'),
+                'dataSrc': img.attributes.get('data-src'),
+                'dataLazySrc': img.attributes.get('data-lazy-src'),
+                'dataOriginal': img.attributes.get('data-original'),
+                'dataLazy': img.attributes.get('data-lazy'),
+                'srcset': img.attributes.get('srcset'),
+            } if img is not None else None,
+            'background': background,
+        }
+
+    async def scrape_listings_async(self) -> List[Dict[str, Any]]:
+        """
+        Async scrape of willhaben.at car listings.
+        All card data is read from the DOM in one page.evaluate() call.
+        """
+        cars = []
+        context = None
+        
+        try:
+            browser = await browser_pool.get_browser()
+            context = await browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                locale='de-AT'
+            )
+            # Image URLs are read from the DOM, the bytes themselves are never needed
+            await context.route('**/*', _block_unneeded_requests)
+            
+            page = await context.new_page()
+            
+            logger.info(f"Navigating to {self.BASE_URL}")
+            await page.goto(self.BASE_URL, wait_until="domcontentloaded", timeout=45000)
+
+            # Handle cookie consent - one auto-waiting click on whichever button is visible
+            # (:visible so a hidden CMP button earlier in the DOM can't win .first)
+            try:
+                cookie_selectors = [
+                    'button#didomi-notice-agree-button:visible',
+                    'button[data-testid="uc-accept-all-button"]:visible',
+                    'button:has-text("Akzeptieren"):visible',  # also matches "Alle akzeptieren"
+                ]
+                await page.locator(', '.join(cookie_selectors)).first.click(timeout=3000)
+                logger.info("Accepted cookies")
+            except Exception as e:
+                logger.info(f"No cookie dialog or already accepted: {e}")
+
+            # Wait until listing links are in the DOM instead of sleeping a fixed time
+            try:
+                await page.wait_for_selector('a[href*="/gebrauchtwagen/"]', state='attached', timeout=10000)
+            except PlaywrightAsyncTimeout:
+                logger.warning("Timed out waiting for listing links")
+            
+            # Scroll to trigger lazy loading until the link count stops growing
+            logger.info("Scrolling to load content...")
+            listing_links = page.locator('a[href*="/gebrauchtwagen/"]')
+            previous_count = await listing_links.count()
+            for _ in range(SCROLL_MAX_STEPS):
+                await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+                # Continue as soon as new links render; none within the settle window means done
+                try:
+                    await page.wait_for_function(
+                        '''prev => document.querySelectorAll('a[href*="/gebrauchtwagen/"]').length > prev''',
+                        arg=previous_count,
+                        timeout=SCROLL_SETTLE_MS
+                    )
+                except PlaywrightAsyncTimeout:
+                    break
+                previous_count = await listing_links.count()
+
+            # Pull everything we need out of the DOM in a single round-trip
+            logger.info("Looking for car listings...")
+            page_data = await page.evaluate(_LISTING_EXTRACT_JS, [
+                CARD_TEXT_MAX_CHARS,
+                _PRICE_SELECTOR,
+                [_LISTING_ID_PATH_RE.pattern, _LISTING_ID_QUERY_RE.pattern],
+            ])
+
+            all_car_links = page_data['links']
+            logger.info(f"Strategy 1: Found {len(all_car_links)} distinct listing links with /gebrauchtwagen/")
+            logger.info(f"Strategy 2: Found {page_data['articleCount']} article elements")
+            logger.info(f"Strategy 3: Found {page_data['containerCount']} potential result containers")
+            
+            car_listings = self._select_listings(all_car_links)
+
+            logger.info(f"Found {len(car_listings)} unique car listings")
+            
+            if len(car_listings) == 0:
+                logger.warning("No car listings found! Saving debug screenshot...")
+                try:
+                    await page.screenshot(path="/tmp/debug_screenshot.png")
+                    # Also save HTML for debugging
+                    html_content = await page.content()
+                    with open("/tmp/debug_page.html", "w", encoding="utf-8") as f:
+                        f.write(html_content)
+                    logger.info("Debug files saved: /tmp/debug_screenshot.png and /tmp/debug_page.html")
+                except:
+                    pass
+                return cars
+            
+            # Card data is already in Python, so building cars is pure parsing
+            cars = self._build_cars(car_listings)
+            
+            logger.info(f"Scraping completed: {len(cars)} cars extracted")
+            
         except Exception as e:
             logger.error(f"Scraping failed: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
+        finally:
+            # Only the context is per-scrape; the browser stays warm in the pool
+            if context:
+                try:
+                    await context.close()
+                except Exception as close_err:
+                    logger.debug(f"Error closing browser context: {close_err}")
+        
+        return cars
+
+    def _select_listings(self, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Dedupe raw cards by listing ID, dropping category/search links"""
+        car_listings = []
+        seen_ids = set()
         
+        for card in cards:
+            href = card.get('href')
+            if not href:
+                continue
+
+            # Build full URL
+            if not href.startswith('http'):
+                full_url = f"https://www.willhaben.at{href}"
+            else:
+                full_url = href
+
+            # Extract numeric ID from URL
+            id_match = _LISTING_ID_PATH_RE.search(href) or _LISTING_ID_QUERY_RE.search(href)
+            
+            if not id_match:
+                continue
+
+            listing_id = id_match.group(1)
+
+            # Skip if we've seen this ID or if it's not a car detail page
+            if listing_id in seen_ids:
+                continue
+            
+            # Make sure it's actually a car listing page, not category/search page
+            if '/gebrauchtwagenboerse' in href or '/kategorie' in href:
+                continue
+                
+            seen_ids.add(listing_id)
+            car_listings.append({
+                'card': card,
+                'url': full_url,
+                'listing_id': listing_id
+            })
+
+        return car_listings
+
+    def _build_cars(self, car_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Turn the first max_cars listings into car dictionaries"""
+        # Show first few examples
+        for i, listing in enumerate(car_listings[:3]):
+            logger.info(f"Example listing {i+1}: {listing['url']}")
+
+        cars = []
+        selected = car_listings[:self.max_cars]
+        for idx, listing_data in enumerate(selected):
+            car = self._build_car(idx, listing_data, len(selected))
+            if car:
+                cars.append(car)
         return cars
+
+    def _build_car(self, idx: int, listing_data: Dict[str, Any], total: int) -> Optional[Dict[str, Any]]:
+        """Build a car dictionary from the raw card data returned by the page"""
+        try:
+            card = listing_data['card']
+            url = listing_data['url']
+            listing_id = listing_data['listing_id']
+            
+            text_content = card.get('text') or ''
+            
+            # Extract title
+            link_text = (card.get('linkText') or '').strip()
+            title = link_text if len(link_text) > 5 else text_content.split('\n')[0]
+            title = title[:500]
+            
+            if not title or len(title) < 3:
+                title = f"Car Listing {listing_id}"
+            
+            # Thumbnail: largest srcset candidate, then lazy-loading attributes, then background-image
+            image_url = None
+            img = card.get('img')
+            if img:
+                raw_url = (
+                    _largest_srcset_url(img.get('srcset')) or
+                    img.get('src') or
+                    img.get('dataSrc') or
+                    img.get('dataLazySrc') or
+                    img.get('dataOriginal') or
+                    img.get('dataLazy')
+                )
+
+                if raw_url:
+                    image_url = self._normalize_image_url(raw_url)
+
+            if not image_url:
+                bg_image = card.get('background') or ''
+                if 'url(' in bg_image:
+                    bg_url = bg_image.split('url(')[-1].rstrip(')').strip('"\' ')
+                    if bg_url:
+                        image_url = self._normalize_image_url(bg_url)
+
+            # Store as array for consistency
+            image_urls = [image_url] if image_url else []
+
+            # Prefer the dedicated price element; card text can contain other € amounts
+            price_text = card.get('priceText')
+            price = (self._extract_price(price_text) if price_text else None) or self._extract_price(text_content)
+            year = self._extract_year(text_content)
+            mileage = self._extract_mileage(text_content)
+            location = self._extract_location(text_content)
+            posted_at = self._extract_posted_date(text_content)
+            brand, model = self._parse_brand_model(title)
+
+            car_data = {
+                'listing_id': listing_id,
+                'title': title,
+                'price': price,
+                'currency': 'EUR',
+                'brand': brand,
+                'model': model,
+                'year': year,
+                'mileage': mileage,
+                'fuel_type': None,
+                'transmission': None,
+                'location': location,
+                'image_urls': image_urls,  # Array instead of single URL
+                'url': url,
+                'description': text_content[:500] if text_content else title,
+                'posted_at': posted_at,  # When car was posted on Willhaben
+            }
+            
+            logger.info(f"✓ {idx + 1}/{total}: {title[:50]}... €{price or '?'}")
+            return car_data
+            
+        except Exception as e:
+            logger.error(f"✗ Error extracting car {idx + 1}: {str(e)}")
+            return None
+
+    def _normalize_image_url(self, image_url: str) -> Optional[str]:
+        """Make a thumbnail URL absolute; drop placeholders and icons"""
+        if image_url.startswith('//'):
+            image_url = f"https:{image_url}"
+        elif image_url.startswith('/'):
+            image_url = f"https://www.willhaben.at{image_url}"
+        elif not image_url.startswith('http'):
+            image_url = f"https://www.willhaben.at/{image_url.lstrip('/')}"
+
+        lower_url = image_url.lower()
+        if 'placeholder' in lower_url or 'icon' in lower_url or image_url.endswith('.svg'):
+            return None
+        return image_url
     
     def _extract_price(self, text: str) -> Optional[float]:
         """Extract price from text"""
-        price_patterns = [r'€\s*([\d.,]+)', r'([\d.,]+)\s*€']
-        for pattern in price_patterns:
-            match = re.search(pattern, text)
+        for pattern in _PRICE_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     price_str = match.group(1).replace('.', '').replace(',', '.')
@@ -447,30 +962,25 @@ class WillhabenScraper:
     
     def _extract_year(self, text: str) -> Optional[int]:
         """Extract year from text"""
-        match = re.search(r'\b(19\d{2}|20[0-2]\d)\b', text)
-        if match:
-            try:
-                year = int(match.group(0))
-                if 1990 <= year <= 2025:
-                    return year
-            except:
-                pass
-        return None
+        match = _YEAR_CUE_RE.search(text) or _YEAR_RE.search(text)
+        if not match:
+            return None
+        year = int(match.group(1))
+        max_year = datetime.now().year + 1  # Next year's models are already on sale
+        return year if 1990 <= year <= max_year else None
     
     def _extract_mileage(self, text: str) -> Optional[int]:
         """Extract mileage from text"""
-        match = re.search(r'([\d.]+)\s*km', text, re.IGNORECASE)
+        match = _MILEAGE_RE.search(text)
         if match:
-            try:
-                mileage_str = match.group(1).replace('.', '')
-                return int(mileage_str)
-            except:
-                pass
+            digits = _NON_DIGIT_RE.sub('', match.group(1))
+            if digits:
+                return int(digits)
         return None
 
     def _extract_location(self, text: str) -> Optional[str]:
         """Extract location from text"""
-        match = re.search(r'\b(\d{4}\s+[A-ZÄÖÜa-zäöüß\s-]+?)(?:\n|$)', text)
+        match = _LOCATION_RE.search(text)
         if match:
             return match.group(1).strip()[:200]
         return None
@@ -481,13 +991,7 @@ class WillhabenScraper:
         now_local = datetime.now(CET)
 
         try:
-            explicit_pattern = re.search(
-                r'(?:zuletzt\s+geändert|erstellt\s+am)\s*:?'  # label
-                r'\s*(\d{1,2}\.\d{1,2}\.\d{4})'            # date
-                r'(?:,\s*(\d{1,2}:\d{2}))?',                 # optional time
-                cleaned,
-                re.IGNORECASE
-            )
+            explicit_pattern = _POSTED_EXPLICIT_RE.search(cleaned)
             if explicit_pattern:
                 date_part = explicit_pattern.group(1)
                 time_part = explicit_pattern.group(2) or '00:00'
@@ -497,15 +1001,15 @@ class WillhabenScraper:
             lowered = cleaned.lower()
 
             if 'vor' in lowered:
-                rel_match = re.search(r'vor\s+(\d+)\s+minute[n]?', lowered)
+                rel_match = _POSTED_MINUTES_RE.search(lowered)
                 if rel_match:
                     return (now_local - timedelta(minutes=int(rel_match.group(1))) + POSTED_AT_HARD_OFFSET).replace(tzinfo=None)
 
-                rel_match = re.search(r'vor\s+(\d+)\s+stunde[n]?', lowered)
+                rel_match = _POSTED_HOURS_RE.search(lowered)
                 if rel_match:
                     return (now_local - timedelta(hours=int(rel_match.group(1))) + POSTED_AT_HARD_OFFSET).replace(tzinfo=None)
 
-                rel_match = re.search(r'vor\s+(\d+)\s+tag[en]?', lowered)
+                rel_match = _POSTED_DAYS_RE.search(lowered)
                 if rel_match:
                     return (now_local - timedelta(days=int(rel_match.group(1))) + POSTED_AT_HARD_OFFSET).replace(tzinfo=None)
 
@@ -515,10 +1019,7 @@ class WillhabenScraper:
             if 'gestern' in lowered:
                 return (now_local - timedelta(days=1) + POSTED_AT_HARD_OFFSET).replace(tzinfo=None)
 
-            fallback_pattern = re.search(
-                r'(\d{1,2})\.(\d{1,2})\.(\d{4})(?:,\s*(\d{1,2}:\d{2}))?',
-                cleaned
-            )
+            fallback_pattern = _POSTED_DATE_RE.search(cleaned)
             if fallback_pattern:
                 day, month, year = map(int, fallback_pattern.group(1, 2, 3))
                 time_part = fallback_pattern.group(4) or '00:00'
@@ -532,38 +1033,138 @@ class WillhabenScraper:
     
     def _parse_brand_model(self, title: str) -> tuple:
         """Parse brand and model from title"""
-        common_brands = [
-            'Abarth', 'Alfa Romeo', 'Aston Martin', 'Audi', 'Bentley', 'BMW', 'Bugatti',
-            'Cadillac', 'Chevrolet', 'Chrysler', 'Citroën', 'Citroen', 'Cupra', 'Dacia',
-            'Dodge', 'Ferrari', 'Fiat', 'Ford', 'Honda', 'Hummer', 'Hyundai', 'Infiniti',
-            'Jaguar', 'Jeep', 'Kia', 'Lamborghini', 'Lancia', 'Land Rover', 'Lexus',
-            'Maserati', 'Mazda', 'McLaren', 'Mercedes-Benz', 'Mercedes', 'MG', 'Mini',
-            'Mitsubishi', 'Nissan', 'Opel', 'Peugeot', 'Porsche', 'Renault', 'Rolls-Royce',
-            'Saab', 'Seat', 'Skoda', 'Smart', 'Subaru', 'Suzuki', 'Tesla', 'Toyota',
-            'Volkswagen', 'VW', 'Volvo'
-        ]
-        
-        title_upper = title.upper()
-        
-        for brand in common_brands:
-            if brand.upper() in title_upper:
-                pattern = re.compile(rf'\b{re.escape(brand)}\b', re.IGNORECASE)
-                match = pattern.search(title)
-                
-                if match:
-                    after_brand = title[match.end():].strip()
-                    model_match = re.match(r'^[\s\-]*([A-Za-z0-9\-]+(?:\s+[A-Za-z0-9\-]+)?)', after_brand)
-                    if model_match:
-                        model = model_match.group(1).strip()
-                        model = re.sub(r'[^\w\s\-]', '', model).strip()
-                        if model and len(model) > 1:
-                            return brand, model
-                
-                return brand, None
-        
-        return None, None
+        match = _BRAND_RE.search(title)
+        if not match:
+            return None, None
+
+        brand = _BRAND_CANONICAL[match.group(1).upper()]
+        after_brand = title[match.end():].strip()
+        model_match = _MODEL_RE.match(after_brand)
+        if model_match:
+            model = _MODEL_CLEAN_RE.sub('', model_match.group(1)).strip()
+            if model and len(model) > 1:
+                return brand, model
+
+        return brand, None
     
-    def scrape_car_details(self, page, car_url: str) -> Dict[str, Any]:
+    def scrape_details(self, car_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several detail pages concurrently on the shared browser.
+        Returns one details dict per URL, in the same order.
+        """
+        return browser_pool.run(self.scrape_details_async(car_urls), timeout=DETAIL_SCRAPE_TIMEOUT_SECONDS)
+
+    async def scrape_details_async(self, car_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch up to DETAIL_SCRAPE_CONCURRENCY detail pages at once. Each page is
+        tried as static HTML first; Playwright (one shared context, opened on
+        first use) only handles the pages that come back without images.
+        """
+        semaphore = asyncio.Semaphore(DETAIL_SCRAPE_CONCURRENCY)
+        context_lock = asyncio.Lock()
+        context = None
+
+        async def get_context():
+            nonlocal context
+            async with context_lock:
+                if context is None:
+                    browser = await browser_pool.get_browser()
+                    context = await browser.new_context(
+                        viewport={'width': 1920, 'height': 1080},
+                        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                        locale='de-AT'
+                    )
+            return context
+
+        async def bounded(car_url: str) -> Dict[str, Any]:
+            # A failure on one page (e.g. the browser restarting) must not
+            # discard the details already fetched for the others
+            async with semaphore:
+                try:
+                    if STATIC_SCRAPE_ENABLED:
+                        details = await asyncio.to_thread(self.scrape_car_details_http, car_url)
+                        if details:
+                            return details
+                    page = await (await get_context()).new_page()
+                    try:
+                        return await self.scrape_car_details(page, car_url)
+                    finally:
+                        await page.close()
+                except Exception as e:
+                    logger.error(f"Error scraping details for {car_url}: {e}")
+                    return {}
+
+        try:
+            return await asyncio.gather(*[bounded(url) for url in car_urls])
+        finally:
+            if context:
+                try:
+                    await context.close()
+                except Exception as close_err:
+                    logger.debug(f"Error closing detail context: {close_err}")
+
+    def scrape_car_details_http(self, car_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a detail page as static HTML and parse it with selectolax.
+        Returns None when the fetch fails or no gallery images are found,
+        so the caller falls back to Playwright.
+        """
+        try:
+            response = http_session.get(car_url, timeout=STATIC_SCRAPE_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            tree = LexborHTMLParser(response.text)
+        except Exception as e:
+            logger.debug(f"Static detail fetch failed for {car_url}: {e}")
+            return None
+
+        images: List[str] = []
+        seen_urls = set()
+        for selector in _GALLERY_IMAGE_SELECTORS:
+            for img in tree.css(selector):
+                attrs = img.attributes
+                url = (
+                    _largest_srcset_url(attrs.get('srcset')) or
+                    attrs.get('src') or
+                    attrs.get('data-src') or
+                    attrs.get('data-original')
+                )
+                if url and url not in seen_urls:
+                    url = self._gallery_image_url(url)
+                    if url:
+                        images.append(url)
+                        seen_urls.add(url)
+
+        if not images:
+            return None
+
+        # Same sources as the browser path: labelled dates first, then metadata blocks
+        metadata_texts: List[str] = []
+        body_text = tree.body.text(separator='\n') if tree.body is not None else ''
+        labelled = _POSTED_EXPLICIT_RE.search(body_text.replace('\u00a0', ' '))
+        if labelled:
+            metadata_texts.append(labelled.group(0))
+        for selector in _DETAIL_METADATA_SELECTORS:
+            metadata_texts.extend(node.text(separator='\n') for node in tree.css(selector))
+
+        logger.info(f"Found {len(images)} images for car (static HTML)")
+        return {
+            'images': images[:10],
+            'posted_at': self._extract_posted_date("\n".join(metadata_texts)) if metadata_texts else None,
+        }
+
+    def _gallery_image_url(self, url: str) -> Optional[str]:
+        """Make a gallery image URL absolute; drop thumbnails and icons"""
+        if url.startswith('//'):
+            url = f"https:{url}"
+        elif url.startswith('/'):
+            url = f"https://www.willhaben.at{url}"
+
+        lower_url = url.lower()
+        if 'thumb' in lower_url or 'icon' in lower_url or url.endswith('.svg'):
+            return None
+        return url
+
+    async def scrape_car_details(self, page, car_url: str) -> Dict[str, Any]:
         """
         Visit car detail page and extract images and metadata
         """
@@ -574,46 +1175,30 @@ class WillhabenScraper:
 
         try:
             logger.info(f"Fetching detail page: {car_url}")
-            page.goto(car_url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(3000)
-
-            # Try multiple selectors for image galleries
-            image_selectors = [
-                'img[class*="gallery"]',
-                '[class*="ImageGallery"] img',
-                '[class*="Carousel"] img',
-                '[data-testid*="image"] img',
-                'picture img',
-                '.image-gallery img'
-            ]
+            await page.goto(car_url, wait_until="domcontentloaded", timeout=30000)
+
+            # Continue as soon as any gallery image is in the DOM
+            try:
+                await page.wait_for_selector(', '.join(_GALLERY_IMAGE_SELECTORS), state='attached', timeout=5000)
+            except PlaywrightAsyncTimeout:
+                logger.debug(f"No gallery images appeared on {car_url}")
 
             seen_urls = set()
 
-            for selector in image_selectors:
-                img_elements = page.query_selector_all(selector)
+            for selector in _GALLERY_IMAGE_SELECTORS:
+                img_elements = await page.query_selector_all(selector)
                 for img in img_elements:
+                    # Prefer the highest-resolution srcset candidate
                     url = (
-                        img.get_attribute('src') or 
-                        img.get_attribute('data-src') or
-                        img.get_attribute('data-original')
+                        _largest_srcset_url(await img.get_attribute('srcset')) or
+                        await img.get_attribute('src') or 
+                        await img.get_attribute('data-src') or
+                        await img.get_attribute('data-original')
                     )
 
-                    # Handle srcset for higher resolution
-                    if not url:
-                        srcset = img.get_attribute('srcset')
-                        if srcset:
-                            urls = [s.strip().split()[0] for s in srcset.split(',') if s.strip()]
-                            if urls:
-                                url = urls[-1]
-
                     if url and url not in seen_urls:
-                        if url.startswith('//'):
-                            url = f"https:{url}"
-                        elif url.startswith('/'):
-                            url = f"https://www.willhaben.at{url}"
-
-                        lower_url = url.lower()
-                        if 'thumb' not in lower_url and 'icon' not in lower_url and not url.endswith('.svg'):
+                        url = self._gallery_image_url(url)
+                        if url:
                             details['images'].append(url)
                             seen_urls.add(url)
 
@@ -624,17 +1209,15 @@ class WillhabenScraper:
             metadata_selectors = [
                 "text=/Zuletzt geändert/i",
                 "text=/Erstellt am/i",
-                '[data-testid*="metadata"]',
-                '[class*="Meta"]',
-                '[class*="Details"]'
+                *_DETAIL_METADATA_SELECTORS
             ]
 
             for selector in metadata_selectors:
                 try:
-                    nodes = page.query_selector_all(selector)
+                    nodes = await page.query_selector_all(selector)
                     for node in nodes:
                         try:
-                            metadata_texts.append(node.inner_text())
+                            metadata_texts.append(await node.inner_text())
                         except Exception:
                             continue
                 except Exception:
@@ -658,12 +1241,75 @@ class WillhabenScraper:
 # BACKGROUND JOBS
 # ============================================================================
 
+_PG_MAX_BIND_PARAMS = 65535  # Protocol limit per statement (16-bit parameter count)
+
+
+def upsert_cars(cars: List[Dict[str, Any]], now: datetime) -> List[str]:
+    """
+    Insert new cars and refresh existing ones with a single INSERT ... ON CONFLICT.
+    Every row gets last_seen_at=now. Returns the listing IDs that were newly inserted.
+    """
+    if not cars:
+        return []
+
+    # ON CONFLICT cannot touch the same row twice within one statement
+    unique_cars = {car['listing_id']: car for car in cars}
+    rows = [
+        dict(car, first_seen_at=now, last_seen_at=now, is_active=True, created_at=now, updated_at=now)
+        for car in unique_cars.values()
+    ]
+
+    # One statement per scrape; only split if the VALUES list would exceed
+    # Postgres's bind-parameter limit (never the case for a ~30-row listing page).
+    # The 100 spare parameters cover the ON CONFLICT SET clause.
+    rows_per_statement = max((_PG_MAX_BIND_PARAMS - 100) // len(rows[0]), 1)
+
+    inserted = []
+    for start in range(0, len(rows), rows_per_statement):
+        stmt = pg_insert(Car.__table__).values(rows[start:start + rows_per_statement])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['listing_id'],
+            set_={
+                'last_seen_at': stmt.excluded.last_seen_at,
+                'is_active': True,
+                'price': stmt.excluded.price,
+                'updated_at': stmt.excluded.updated_at,
+                # Only overwrite posted_at / images if this scrape found new data
+                'posted_at': func.coalesce(stmt.excluded.posted_at, Car.posted_at),
+                'image_urls': case(
+                    (func.cardinality(stmt.excluded.image_urls) > 0, stmt.excluded.image_urls),
+                    else_=Car.image_urls,
+                ),
+            },
+        ).returning(Car.listing_id, literal_column('xmax = 0').label('inserted'))
+
+        result = db.session.execute(stmt)
+        inserted.extend(row.listing_id for row in result if row.inserted)
+    return inserted
+
+
+# Held while a scrape runs; scheduled and manual (/api/trigger-scrape) jobs have
+# different job IDs, so max_instances alone doesn't keep them from overlapping
+_scrape_lock = threading.Lock()
+
+
 def scrape_and_store_cars():
+    """Fast scraping job - skipped if another scrape in this process is still running"""
+    if not _scrape_lock.acquire(blocking=False):
+        logger.info("Scrape already running, skipping this run")
+        return
+    try:
+        _scrape_and_store_cars()
+    finally:
+        _scrape_lock.release()
+
+
+def _scrape_and_store_cars():
     """Fast scraping job - thumbnails only for speed"""
     with app.app_context():
-        log_entry = ScrapingLog()
-        db.session.add(log_entry)
-        db.session.commit()
+        # The log row is written once, when the outcome is known
+        started_at = datetime.utcnow()
+        cars_found = 0
         
         try:
             logger.info("Starting FAST scraping job (thumbnails only)...")
@@ -672,58 +1318,48 @@ def scrape_and_store_cars():
             scraper = WillhabenScraper(max_cars=FAST_SCRAPE_MAX_CARS, full_image_scraping=False)
             scraped_cars = scraper.scrape_listings()
             
-            log_entry.cars_found = len(scraped_cars)
-            cars_added = 0
-            cars_updated = 0
-            newly_added_listing_ids: List[str] = []
+            cars_found = len(scraped_cars)
             
-            # Get all current listing IDs to mark inactive
+            # Unique listing IDs seen in this scrape
             current_listing_ids = {car['listing_id'] for car in scraped_cars}
             
+            # One timestamp for the whole run: upserted cars get it as last_seen_at
+            seen_at = datetime.utcnow()
+            newly_added_listing_ids = upsert_cars(scraped_cars, seen_at)
+            cars_added = len(newly_added_listing_ids)
+            cars_updated = len(current_listing_ids) - cars_added
+            
+            new_ids = set(newly_added_listing_ids)
             for car_data in scraped_cars:
-                existing_car = Car.query.filter_by(listing_id=car_data['listing_id']).first()
-                
-                if existing_car:
-                    # Update existing car
-                    existing_car.last_seen_at = datetime.utcnow()
-                    existing_car.is_active = True
-                    existing_car.price = car_data.get('price')
-                    existing_car.updated_at = datetime.utcnow()
-                    # Update posted_at if we have new data
-                    if car_data.get('posted_at'):
-                        existing_car.posted_at = car_data.get('posted_at')
-                    if car_data.get('image_urls'):
-                        existing_car.image_urls = car_data.get('image_urls')
-                    cars_updated += 1
-                else:
-                    # Add new car
-                    new_car = Car(**car_data)
-                    db.session.add(new_car)
-                    cars_added += 1
+                if car_data['listing_id'] in new_ids:
                     logger.info(f"🆕 NEW CAR: {car_data.get('title', 'Unknown')} - Posted: {car_data.get('posted_at', 'Unknown')}")
-                    newly_added_listing_ids.append(car_data['listing_id'])
             
             # Mark cars as inactive if not seen in this scrape
             if current_listing_ids and len(scraped_cars) > 10:  # Safeguard: Only deactivate if >10 cars scraped
-                inactive_count = Car.query.filter(
-                    and_(
-                        Car.listing_id.notin_(current_listing_ids),
-                        Car.is_active == True
-                    )
-                ).update({'is_active': False}, synchronize_session=False)
+                # Anything this run didn't refresh is gone; no ID list sent to Postgres
+                inactive_count = db.session.execute(
+                    update(Car)
+                    .where(Car.is_active == True, Car.last_seen_at < seen_at)
+                    .values(is_active=False),
+                    execution_options={'synchronize_session': False}
+                ).rowcount
                 logger.info(f"Marked {inactive_count} cars as inactive")
             else:
                 logger.warning("Skipping deactivation: Too few cars scraped or scrape failed")
             
-            db.session.commit()
-            
-            log_entry.scrape_completed_at = datetime.utcnow()
-            log_entry.cars_added = cars_added
-            log_entry.cars_updated = cars_updated
-            log_entry.status = 'success'
+            # The log row commits together with the upsert and deactivation
+            db.session.add(ScrapingLog(
+                scrape_started_at=started_at,
+                scrape_completed_at=datetime.utcnow(),
+                cars_found=cars_found,
+                cars_added=cars_added,
+                cars_updated=cars_updated,
+                status='success'
+            ))
             db.session.commit()
             
             logger.info(f"Scraping completed: {cars_added} added, {cars_updated} updated, {len(scraped_cars)} total")
+            clear_response_cache()
 
             if newly_added_listing_ids:
                 try:
@@ -733,10 +1369,16 @@ def scrape_and_store_cars():
             
         except Exception as e:
             logger.error(f"Scraping job failed: {str(e)}")
-            log_entry.status = 'failed'
-            log_entry.error_message = str(e)
-            log_entry.scrape_completed_at = datetime.utcnow()
+            db.session.rollback()
+            db.session.add(ScrapingLog(
+                scrape_started_at=started_at,
+                scrape_completed_at=datetime.utcnow(),
+                cars_found=cars_found,
+                status='failed',
+                error_message=str(e)
+            ))
             db.session.commit()
+            clear_response_cache()
 
 
 def enrich_cars_with_images():
@@ -746,9 +1388,9 @@ def enrich_cars_with_images():
             logger.info("Starting image enrichment job...")
             
             # Find candidates and filter for cars that only have 1 or 0 images (thumbnails only)
-            candidate_cars = Car.query.filter(
-                Car.is_active == True
-            ).order_by(Car.first_seen_at.desc()).limit(200).all()
+            candidate_cars = db.session.scalars(
+                select(Car).where(Car.is_active == True).order_by(Car.first_seen_at.desc()).limit(200)
+            ).all()
 
             cars_needing_images = []
             for car in candidate_cars:
@@ -766,50 +1408,37 @@ def enrich_cars_with_images():
             
             logger.info(f"Found {len(cars_needing_images)} cars needing full images")
             
-            # Use Playwright to visit detail pages
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
-                )
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    locale='de-AT'
-                )
-                page = context.new_page()
-                
-                scraper = WillhabenScraper(max_cars=1, full_image_scraping=False)
-                enriched_count = 0
-                
-                for car in cars_needing_images:
-                    try:
-                        logger.info(f"Enriching details for: {car.title[:50]}...")
-
-                        details = scraper.scrape_car_details(page, car.url)
-                        full_images = details.get('images', [])
-                        posted_at = details.get('posted_at')
-
-                        if full_images and len(full_images) > max(len(car.image_urls or []), 1):
-                            car.image_urls = full_images
-                            enriched_count += 1
-                            logger.info(f"✓ Added {len(full_images)} images to {car.listing_id}")
-                        else:
-                            logger.debug(f"No additional images found for {car.listing_id}")
-
-                        if posted_at and car.posted_at != posted_at:
-                            car.posted_at = posted_at
-                            logger.info(f"✓ Updated posted_at for {car.listing_id} -> {posted_at}")
-
-                        car.updated_at = datetime.utcnow()
-                        
-                    except Exception as e:
-                        logger.error(f"Error enriching car {car.listing_id}: {str(e)}")
-                        continue
-                
-                browser.close()
+            # Detail pages are fetched concurrently on the shared browser;
+            # the DB updates below stay on this job thread
+            scraper = WillhabenScraper(max_cars=1, full_image_scraping=False)
+            all_details = scraper.scrape_details([car.url for car in cars_needing_images])
+            now = datetime.utcnow()
+            enriched_count = 0
+            
+            for car, details in zip(cars_needing_images, all_details):
+                try:
+                    full_images = details.get('images', [])
+                    posted_at = details.get('posted_at')
+
+                    if full_images and len(full_images) > max(len(car.image_urls or []), 1):
+                        car.image_urls = full_images
+                        enriched_count += 1
+                        logger.info(f"✓ Added {len(full_images)} images to {car.listing_id}")
+                    else:
+                        logger.debug(f"No additional images found for {car.listing_id}")
+
+                    if posted_at and car.posted_at != posted_at:
+                        car.posted_at = posted_at
+                        logger.info(f"✓ Updated posted_at for {car.listing_id} -> {posted_at}")
+
+                    car.updated_at = now
+                    
+                except Exception as e:
+                    logger.error(f"Error enriching car {car.listing_id}: {str(e)}")
+                    continue
             
             db.session.commit()
+            clear_response_cache()
             logger.info(f"Image enrichment completed: {enriched_count}/{len(cars_needing_images)} cars enriched")
             
         except Exception as e:
@@ -825,48 +1454,37 @@ def priority_enrich_latest(listing_ids: List[str], max_items: int = 10):
     limited_ids = list(dict.fromkeys(listing_ids))[:max_items]
     logger.info(f"Priority enriching latest listings: {limited_ids}")
 
-    cars = Car.query.filter(Car.listing_id.in_(limited_ids)).all()
+    cars = db.session.scalars(select(Car).where(Car.listing_id.in_(limited_ids))).all()
     if not cars:
         return
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
-            )
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                locale='de-AT'
-            )
-            page = context.new_page()
-            scraper = WillhabenScraper(max_cars=1, full_image_scraping=False)
+        scraper = WillhabenScraper(max_cars=1, full_image_scraping=False)
+        all_details = scraper.scrape_details([car.url for car in cars])
+        now = datetime.utcnow()
 
-            enriched = 0
-            for car in cars:
-                try:
-                    details = scraper.scrape_car_details(page, car.url)
-                    images = details.get('images') or []
-                    posted_at = details.get('posted_at')
-
-                    if images and (not car.image_urls or len(car.image_urls) <= 1):
-                        car.image_urls = images
-                        logger.info(f"Priority: updated images for {car.listing_id}")
+        enriched = 0
+        for car, details in zip(cars, all_details):
+            try:
+                images = details.get('images') or []
+                posted_at = details.get('posted_at')
 
-                    if posted_at and (car.posted_at is None or car.posted_at != posted_at):
-                        car.posted_at = posted_at
-                        logger.info(f"Priority: updated posted_at for {car.listing_id} -> {posted_at}")
+                if images and (not car.image_urls or len(car.image_urls) <= 1):
+                    car.image_urls = images
+                    logger.info(f"Priority: updated images for {car.listing_id}")
 
-                    car.updated_at = datetime.utcnow()
-                    enriched += 1
-                except Exception as detail_err:
-                    logger.error(f"Priority enrichment failed for {car.listing_id}: {detail_err}")
-                    continue
+                if posted_at and (car.posted_at is None or car.posted_at != posted_at):
+                    car.posted_at = posted_at
+                    logger.info(f"Priority: updated posted_at for {car.listing_id} -> {posted_at}")
 
-            browser.close()
+                car.updated_at = now
+                enriched += 1
+            except Exception as detail_err:
+                logger.error(f"Priority enrichment failed for {car.listing_id}: {detail_err}")
+                continue
 
         db.session.commit()
+        clear_response_cache()
         logger.info(f"Priority enrichment complete: {enriched}/{len(cars)} listings updated")
 
     except Exception as exc:
@@ -874,20 +1492,30 @@ def priority_enrich_latest(listing_ids: List[str], max_items: int = 10):
         db.session.rollback()
 
 
+def db_heartbeat():
+    """Ping the database and record the result for /health"""
+    with app.app_context():
+        try:
+            db.session.execute(text('SELECT 1'))
+            _db_heartbeat.update(ok_at=datetime.utcnow(), error=None)
+        except Exception as e:
+            logger.warning(f"Database heartbeat failed: {e}")
+            _db_heartbeat.update(error=str(e))
+
+
 def cleanup_inactive_cars():
     """Daily cleanup job to remove old inactive cars"""
     with app.app_context():
         try:
             logger.info("Starting daily cleanup job...")
             
-            # Remove cars that have been inactive for more than 7 days
-            cutoff_date = datetime.utcnow() - timedelta(days=7)
-            deleted_count = Car.query.filter(
-                and_(
-                    Car.is_active == False,
-                    Car.last_seen_at < cutoff_date
-                )
-            ).delete()
+            # Remove cars that have been inactive for more than 7 days.
+            # The cutoff is computed by Postgres (timestamps are stored as naive UTC).
+            cutoff_date = func.timezone('utc', func.now()) - timedelta(days=7)
+            deleted_count = db.session.execute(
+                delete(Car).where(Car.is_active == False, Car.last_seen_at < cutoff_date),
+                execution_options={'synchronize_session': False}
+            ).rowcount
             
             db.session.commit()
             logger.info(f"Cleanup completed: {deleted_count} cars removed")
@@ -904,14 +1532,26 @@ def cleanup_inactive_cars():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
+    now = datetime.utcnow()
+    ok_at = _db_heartbeat['ok_at']
+    if _db_heartbeat['error'] is None and ok_at is not None and now - ok_at <= DB_HEARTBEAT_MAX_AGE:
+        return jsonify({
+            'status': 'healthy',
+            'database': 'connected',
+            'timestamp': now.isoformat()
+        }), 200
+
+    # Heartbeat failing or stale (e.g. scheduler not running yet): probe directly
     try:
         db.session.execute(text('SELECT 1'))
+        _db_heartbeat.update(ok_at=now, error=None)
         return jsonify({
             'status': 'healthy',
             'database': 'connected',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now.isoformat()
         }), 200
     except Exception as e:
+        _db_heartbeat.update(error=str(e))
         return jsonify({
             'status': 'unhealthy',
             'database': 'disconnected',
@@ -920,31 +1560,30 @@ def health_check():
 
 
 @app.route('/api/cars', methods=['GET'])
+@cached_response
 def get_cars():
     """Get paginated list of cars - sorted by most recent first"""
     try:
-        page = request.args.get('page', 1, type=int)
+        page = max(request.args.get('page', 1, type=int), 1)
         limit = request.args.get('limit', 20, type=int)
-        limit = min(limit, 100)
+        limit = min(limit, 100) if limit > 0 else 20
         
         # Sort by posted_at (when car was uploaded to Willhaben), then last_seen_at
-        query = Car.query.filter_by(is_active=True).order_by(
-            Car.posted_at.desc().nulls_last(), 
-            Car.last_seen_at.desc(), 
-            Car.first_seen_at.desc()
+        rows, total = _paginated_rows(
+            select(*_CAR_LIST_COLUMNS)
+            .where(Car.is_active == True)
+            .order_by(
+                Car.posted_at.desc().nulls_last(), 
+                Car.last_seen_at.desc(), 
+                Car.first_seen_at.desc()
+            ),
+            page,
+            limit
         )
-        pagination = query.paginate(page=page, per_page=limit, error_out=False)
         
         return jsonify({
-            'cars': [car.to_dict() for car in pagination.items],
-            'pagination': {
-                'page': page,
-                'limit': limit,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
-            }
+            'cars': [_car_row_to_dict(row) for row in rows],
+            'pagination': _pagination_dict(page, limit, total)
         }), 200
     except Exception as e:
         logger.error(f"Error in get_cars: {str(e)}")
@@ -955,7 +1594,9 @@ def get_cars():
 def get_car(listing_id):
     """Get single car by listing ID"""
     try:
-        car = Car.query.filter_by(listing_id=listing_id, is_active=True).first()
+        car = db.session.execute(
+            select(Car).where(Car.listing_id == listing_id, Car.is_active == True)
+        ).scalar_one_or_none()
         if not car:
             return jsonify({'error': 'Car not found'}), 404
         return jsonify({'car': car.to_dict()}), 200
@@ -965,8 +1606,15 @@ def get_car(listing_id):
 
 
 @app.route('/api/cars/search', methods=['GET'])
+@cached_response
 def search_cars():
-    """Search cars with filters"""
+    """
+    Search cars with filters.
+    brand is a case-insensitive prefix match ("merc" finds "Mercedes-Benz",
+    "benz" does not); model is a case-insensitive substring match.
+    Pass ?after=<next_cursor> (empty for the first page) to page by keyset
+    instead of page/limit; keyset pages skip the total count.
+    """
     try:
         brand = request.args.get('brand')
         model = request.args.get('model')
@@ -974,30 +1622,52 @@ def search_cars():
         max_price = request.args.get('max_price', type=float)
         min_year = request.args.get('min_year', type=int)
         max_year = request.args.get('max_year', type=int)
-        page = request.args.get('page', 1, type=int)
+        after = request.args.get('after')
+        page = max(request.args.get('page', 1, type=int), 1)
         limit = request.args.get('limit', 20, type=int)
+        limit = min(limit, 100) if limit > 0 else 20
         
-        query = Car.query.filter_by(is_active=True)
+        query = select(*_CAR_COLUMNS).where(Car.is_active == True)
         
         if brand:
-            query = query.filter(Car.brand.ilike(f'%{brand}%'))
+            # Prefix match so ix_cars_brand_lower can serve it
+            query = query.where(func.lower(Car.brand).like(_escape_like(brand.lower()) + '%', escape='/'))
         if model:
-            query = query.filter(Car.model.ilike(f'%{model}%'))
+            # Substring match, served by the ix_cars_model_trgm trigram index
+            query = query.where(Car.model.ilike(f'%{_escape_like(model)}%', escape='/'))
         if min_price is not None:
-            query = query.filter(Car.price >= min_price)
+            query = query.where(Car.price >= min_price)
         if max_price is not None:
-            query = query.filter(Car.price <= max_price)
+            query = query.where(Car.price <= max_price)
         if min_year is not None:
-            query = query.filter(Car.year >= min_year)
+            query = query.where(Car.year >= min_year)
         if max_year is not None:
-            query = query.filter(Car.year <= max_year)
+            query = query.where(Car.year <= max_year)
         
-        query = query.order_by(Car.first_seen_at.desc())
-        limit = min(limit, 100)
-        pagination = query.paginate(page=page, per_page=limit, error_out=False)
+        query = query.order_by(Car.first_seen_at.desc(), Car.id.desc())
+        
+        if after is not None:
+            # Keyset pagination: seek past the cursor on ix_cars_active_first_seen_id
+            if after:
+                try:
+                    after_ts, after_id = _decode_cursor(after)
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                query = query.where(tuple_(Car.first_seen_at, Car.id) < tuple_(after_ts, after_id))
+            rows = db.session.execute(query.limit(limit + 1)).all()
+            has_next = len(rows) > limit
+            rows = rows[:limit]
+            pagination = {
+                'limit': limit,
+                'has_next': has_next,
+                'next_cursor': _encode_cursor(rows[-1]) if has_next else None
+            }
+        else:
+            rows, total = _paginated_rows(query, page, limit)
+            pagination = _pagination_dict(page, limit, total)
         
         return jsonify({
-            'cars': [car.to_dict() for car in pagination.items],
+            'cars': [_car_row_to_dict(row) for row in rows],
             'filters': {
                 'brand': brand,
                 'model': model,
@@ -1006,14 +1676,7 @@ def search_cars():
                 'min_year': min_year,
                 'max_year': max_year
             },
-            'pagination': {
-                'page': page,
-                'limit': limit,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
-            }
+            'pagination': pagination
         }), 200
     except Exception as e:
         logger.error(f"Error in search_cars: {str(e)}")
@@ -1024,18 +1687,27 @@ def search_cars():
 def get_latest_car():
     """Get the single most recent car uploaded"""
     try:
-        # Get the most recently posted car (by Willhaben upload time)
-        latest_car = Car.query.filter_by(is_active=True).order_by(
-            Car.posted_at.desc().nulls_last(),
-            Car.last_seen_at.desc(), 
-            Car.first_seen_at.desc()
-        ).first()
-        
-        if not latest_car:
-            return jsonify({'error': 'No cars found'}), 404
+        with _response_cache_lock:
+            car = _latest_car_cache.get('car')
+        if car is None:
+            # Get the most recently posted car (by Willhaben upload time)
+            latest_car = db.session.scalars(
+                select(Car).where(Car.is_active == True).order_by(
+                    Car.posted_at.desc().nulls_last(),
+                    Car.last_seen_at.desc(),
+                    Car.first_seen_at.desc()
+                ).limit(1)
+            ).first()
+            
+            if not latest_car:
+                return jsonify({'error': 'No cars found'}), 404
+            
+            car = latest_car.to_dict()
+            with _response_cache_lock:
+                _latest_car_cache['car'] = car
         
         return jsonify({
-            'car': latest_car.to_dict(),
+            'car': car,
             'timestamp': datetime.utcnow().isoformat()
         }), 200
     except Exception as e:
@@ -1044,6 +1716,7 @@ def get_latest_car():
 
 
 @app.route('/api/cars/recent', methods=['GET'])
+@cached_response
 def get_recent_cars():
     """Get most recently seen cars (within last 24 hours or most recent)"""
     try:
@@ -1052,19 +1725,21 @@ def get_recent_cars():
         limit = min(limit, 100)
         
         # Sort by posted_at to show the most recently uploaded cars on Willhaben
-        cars = Car.query.filter(
-            and_(
-                Car.is_active == True,
-                Car.first_seen_at >= cutoff_time
-            )
-        ).order_by(
-            Car.posted_at.desc().nulls_last(),
-            Car.last_seen_at.desc(), 
-            Car.first_seen_at.desc()
-        ).limit(limit).all()
+        cars = db.session.execute(
+            select(*_CAR_COLUMNS).where(
+                and_(
+                    Car.is_active == True,
+                    Car.first_seen_at >= cutoff_time
+                )
+            ).order_by(
+                Car.posted_at.desc().nulls_last(),
+                Car.last_seen_at.desc(), 
+                Car.first_seen_at.desc()
+            ).limit(limit)
+        ).all()
         
         return jsonify({
-            'cars': [car.to_dict() for car in cars],
+            'cars': [_car_row_to_dict(row) for row in cars],
             'count': len(cars),
             'cutoff_time': cutoff_time.isoformat()
         }), 200
@@ -1074,12 +1749,20 @@ def get_recent_cars():
 
 
 @app.route('/api/stats', methods=['GET'])
+@cached_response
 def get_stats():
     """Get scraping statistics"""
     try:
-        total_cars = Car.query.filter_by(is_active=True).count()
-        total_brands = db.session.query(func.count(func.distinct(Car.brand))).scalar()
-        recent_scrape = ScrapingLog.query.order_by(ScrapingLog.scrape_started_at.desc()).first()
+        # Both counts in one pass over cars (brands are counted across all cars, as before)
+        total_cars, total_brands = db.session.execute(
+            select(
+                func.count().filter(Car.is_active == True),
+                func.count(func.distinct(Car.brand))
+            )
+        ).one()
+        recent_scrape = db.session.scalars(
+            select(ScrapingLog).order_by(ScrapingLog.scrape_started_at.desc()).limit(1)
+        ).first()
         
         stats = {
             'total_active_cars': total_cars,
@@ -1097,15 +1780,59 @@ def get_stats():
 
 @app.route('/api/trigger-scrape', methods=['POST'])
 def trigger_scrape():
-    """Manual trigger for scraping"""
+    """Queue a manual scrape on the background scheduler"""
     try:
-        scrape_and_store_cars()
-        return jsonify({'message': 'Scraping job triggered successfully'}), 200
+        job_id = f'manual_scrape_{uuid4().hex}'
+        app.extensions['scheduler'].add_job(
+            func=scrape_and_store_cars,
+            id=job_id,
+            name='Manual scrape',
+            next_run_time=datetime.now(pytz.utc),
+            misfire_grace_time=60  # Still run if the thread pool is busy for a while
+        )
+        return jsonify({'message': 'Scraping job queued', 'job_id': job_id}), 202
     except Exception as e:
         logger.error(f"Error triggering scrape: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/scrape-status/<job_id>', methods=['GET'])
+def get_scrape_status(job_id):
+    """
+    Poll a queued scrape: pending state plus the latest scrape log entry.
+    last_scrape is global - the most recent scrape of any kind, not
+    necessarily this job's (a manual job is skipped if a scrape is already
+    running, in which case that scrape's log row is the relevant one).
+    """
+    try:
+        queued = app.extensions['scheduler'].get_job(job_id) is not None
+        recent_scrape = db.session.scalars(
+            select(ScrapingLog).order_by(ScrapingLog.scrape_started_at.desc()).limit(1)
+        ).first()
+        
+        last_scrape = None
+        if recent_scrape:
+            last_scrape = {
+                'started_at': recent_scrape.scrape_started_at.isoformat() if recent_scrape.scrape_started_at else None,
+                'completed_at': recent_scrape.scrape_completed_at.isoformat() if recent_scrape.scrape_completed_at else None,
+                'status': recent_scrape.status,
+                'cars_found': recent_scrape.cars_found,
+                'cars_added': recent_scrape.cars_added,
+                'cars_updated': recent_scrape.cars_updated,
+                'error_message': recent_scrape.error_message
+            }
+        
+        return jsonify({
+            'job_id': job_id,
+            'queued': queued,
+            'scrape_running': _scrape_lock.locked(),
+            'last_scrape': last_scrape
+        }), 200
+    except Exception as e:
+        logger.error(f"Error in get_scrape_status: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 # ============================================================================
 # SCHEDULER SETUP
 # ============================================================================
@@ -1114,7 +1841,7 @@ def init_scheduler():
     """Initialize APScheduler with background jobs"""
     scheduler = BackgroundScheduler(timezone='UTC')
     
-    # STAGE 1: Fast scraping - thumbnails only (every 0.01 seconds by default)
+    # STAGE 1: Fast scraping - thumbnails only (every 60 seconds by default)
     scheduler.add_job(
         func=scrape_and_store_cars,
         trigger=IntervalTrigger(seconds=FAST_SCRAPE_INTERVAL_SECONDS),
@@ -1122,7 +1849,8 @@ def init_scheduler():
         name=f'Fast scrape (thumbnails) every {FAST_SCRAPE_INTERVAL_SECONDS} seconds',
         replace_existing=True,
         max_instances=1,
-        coalesce=True
+        coalesce=True,
+        misfire_grace_time=30  # A run delayed past this is skipped; the next interval catches up
     )
     
     # STAGE 2: Image enrichment - full galleries (every 2 minutes)
@@ -1134,6 +1862,18 @@ def init_scheduler():
         replace_existing=True
     )
     
+    # Database heartbeat read by /health
+    scheduler.add_job(
+        func=db_heartbeat,
+        trigger=IntervalTrigger(seconds=DB_HEARTBEAT_INTERVAL_SECONDS),
+        id='db_heartbeat_job',
+        name=f'Database heartbeat every {DB_HEARTBEAT_INTERVAL_SECONDS} seconds',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(pytz.utc)
+    )
+    
     # STAGE 3: Daily cleanup
     scheduler.add_job(
         func=cleanup_inactive_cars,
@@ -1145,6 +1885,7 @@ def init_scheduler():
     
     scheduler.start()
     logger.info("Scheduler started")
+    app.extensions['scheduler'] = scheduler  # Used by /api/trigger-scrape
     atexit.register(lambda: scheduler.shutdown())
     
     return scheduler
@@ -1154,25 +1895,110 @@ def init_scheduler():
 # APP INITIALIZATION
 # ============================================================================
 
+# Idempotent schema changes for databases created by older versions of the
+# model (db.create_all() never alters existing tables). Run in autocommit
+# mode so indexes can be built CONCURRENTLY without locking writes.
+SCHEMA_MIGRATIONS = [
+    ('posted_at column', """
+        ALTER TABLE cars 
+        ADD COLUMN IF NOT EXISTS posted_at TIMESTAMP
+    """),
+    ('ix_cars_active_posted index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_active_posted
+        ON cars (is_active, posted_at DESC NULLS LAST, last_seen_at DESC, first_seen_at DESC)
+    """),
+    ('ix_cars_brand_lower index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_brand_lower
+        ON cars (lower(brand) text_pattern_ops)
+    """),
+    ('ix_cars_price index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_price ON cars (price)
+    """),
+    ('ix_cars_year index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_year ON cars (year)
+    """),
+    ('ix_cars_active_first_seen_id index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_active_first_seen_id
+        ON cars (first_seen_at DESC, id DESC) WHERE is_active
+    """),
+    ('price as double precision', """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'cars' AND column_name = 'price' AND data_type = 'numeric'
+            ) THEN
+                ALTER TABLE cars ALTER COLUMN price TYPE DOUBLE PRECISION;
+            END IF;
+        END $$
+    """),
+    ('ix_cars_active_last_seen index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_active_last_seen
+        ON cars (is_active, last_seen_at)
+    """),
+    ('image_urls as text[]', """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'cars' AND column_name = 'image_urls' AND data_type = 'json'
+            ) THEN
+                ALTER TABLE cars ADD COLUMN image_urls_array TEXT[];
+                UPDATE cars SET image_urls_array = ARRAY(
+                    SELECT url FROM json_array_elements_text(image_urls) WITH ORDINALITY AS t(url, n)
+                    ORDER BY n
+                )
+                WHERE json_typeof(image_urls) = 'array';
+                ALTER TABLE cars DROP COLUMN image_urls;
+                ALTER TABLE cars RENAME COLUMN image_urls_array TO image_urls;
+            END IF;
+        END $$
+    """),
+    # Trigram index for the model ILIKE '%x%' search. Only created here (not on
+    # the model) so create_all() still works where pg_trgm can't be installed.
+    ('pg_trgm extension', """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm
+    """),
+    ('ix_cars_model_trgm index', """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cars_model_trgm
+        ON cars USING gin (model gin_trgm_ops)
+    """),
+    ('drop ix_cars_is_active index', """
+        DROP INDEX CONCURRENTLY IF EXISTS ix_cars_is_active
+    """),
+]
+
+
+def run_migrations():
+    """Apply SCHEMA_MIGRATIONS one statement at a time"""
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        # Index builds can run well past the API statement_timeout
+        conn.execute(text("SET statement_timeout = 0"))
+        try:
+            for name, statement in SCHEMA_MIGRATIONS:
+                try:
+                    conn.execute(text(statement))
+                    logger.info(f"Database migration: {name} added/verified")
+                except Exception as e:
+                    logger.warning(f"Migration '{name}' may have already run or failed: {e}")
+        finally:
+            # The connection goes back to the pool; restore the connect-time timeout
+            try:
+                conn.execute(text("RESET statement_timeout"))
+            except Exception as e:
+                logger.warning(f"Could not reset statement_timeout, discarding connection: {e}")
+                conn.invalidate()
+
+
 def init_app():
     """Initialize the application"""
     with app.app_context():
         db.create_all()
         logger.info("Database tables created")
         
-        # Run migration to add posted_at column if it doesn't exist
-        try:
-            db.session.execute(text("""
-                ALTER TABLE cars 
-                ADD COLUMN IF NOT EXISTS posted_at TIMESTAMP
-            """))
-            db.session.commit()
-            logger.info("Database migration: posted_at column added/verified")
-        except Exception as e:
-            logger.warning(f"Migration may have already run or failed: {e}")
-            db.session.rollback()
+        run_migrations()
         
-        car_count = Car.query.count()
+        car_count = db.session.scalar(select(func.count()).select_from(Car))
         if car_count == 0:
             logger.info("No cars in database, running initial scrape...")
             try: